@@ -1,11 +1,127 @@
-# automatically generated by the FlatBuffers compiler, do not modify
+# Originally generated by the FlatBuffers compiler, then hand-edited.
+#
+# The table reader classes have been optimized by hand, so this file must not
+# be overwritten with fresh flatc output. `make schema-py` writes the flatc
+# output to a separate file instead. Schema changes have to be merged into
+# this file manually, including the lookup tables at the end of the module.
+# See "Updating the Python schema module" in docs/adding-operators.md.
 
 # namespace: 
 
+import math
+import struct
+
 import flatbuffers
 from flatbuffers.compat import import_numpy
+from flatbuffers.table import Table as _Table
+# `flatbuffers.encode` already imports NumPy when it is available, so importing
+# it eagerly here adds no startup cost.
 np = import_numpy()
 
+
+# File identifier declared in the schema.
+_FILE_ID = b"RTEN"
+
+_U8 = struct.Struct("<B").unpack_from
+_U16 = struct.Struct("<H").unpack_from
+_I32 = struct.Struct("<i").unpack_from
+_U32 = struct.Struct("<I").unpack_from
+_U64 = struct.Struct("<Q").unpack_from
+_F32 = struct.Struct("<f").unpack_from
+_BOOL = struct.Struct("<?").unpack_from
+_GetVectorAsNumpy = flatbuffers.encode.GetVectorAsNumpy
+
+
+# Unpackers which decode the first N field offsets of a vtable, indexed by N.
+# This must cover the table with the most fields in the schema (`Metadata`).
+_VOFFSETS = tuple(struct.Struct("<%dH" % n).unpack_from for n in range(9))
+
+
+def _field_offsets_reader(count):
+    """
+    Create a function which reads the vtable offsets of the first `count`
+    fields in a table.
+
+    The returned function takes `(buf, pos)` arguments and decodes all offsets
+    with a single unpack. The field count and unpackers are bound as defaults
+    so that they are local variable reads. Fields which are not present in the
+    vtable have an offset of zero.
+    """
+
+    def read(buf, pos, _count=count, _unpack=_VOFFSETS[count], _I32=_I32, _U16=_U16):
+        vtable = pos - _I32(buf, pos)[0]
+        present = (_U16(buf, vtable)[0] - 4) >> 1
+        if present >= _count:
+            return _unpack(buf, vtable + 4)
+        return _VOFFSETS[present](buf, vtable + 4) + (0,) * (_count - present)
+
+    return read
+
+
+# Field offset readers specialized for each table size, indexed by field count.
+_FIELD_OFFSETS = tuple(_field_offsets_reader(n) for n in range(len(_VOFFSETS)))
+
+
+# The helpers below bind the unpackers they use as default arguments, so that
+# they are read as local variables rather than globals.
+
+
+def _vector(buf, pos, o, _U32=_U32):
+    """Return the start of the data of the vector stored in field offset `o`."""
+    pos += o
+    return pos + _U32(buf, pos)[0] + 4
+
+
+def _vector_len(buf, pos, o, _U32=_U32):
+    """Return the length of the vector stored in field offset `o`."""
+    pos += o
+    return _U32(buf, pos + _U32(buf, pos)[0])[0]
+
+
+def _vector_as_numpy(buf, pos, o, dtype, _U32=_U32, _GetVectorAsNumpy=_GetVectorAsNumpy):
+    """Return a view of the vector stored in field offset `o` as a NumPy array."""
+    pos += o
+    pos += _U32(buf, pos)[0]
+    return _GetVectorAsNumpy(dtype, buf, _U32(buf, pos)[0], pos + 4)
+
+
+def _vector_as_tuple(buf, pos, o, code, _U32=_U32, _unpack_from=struct.unpack_from):
+    """
+    Decode the vector stored in field offset `o` into a tuple.
+
+    `code` is the `struct` format character for the element type. This is
+    cheaper than creating a NumPy array for short vectors such as shapes.
+    """
+    pos += o
+    pos += _U32(buf, pos)[0]
+    return _unpack_from("<%d%s" % (_U32(buf, pos)[0], code), buf, pos + 4)
+
+
+def _table_positions(buf, vec, count, _unpack_from=struct.unpack_from):
+    """
+    Return the absolute positions of the tables referenced by a vector of
+    `count` uoffsets whose data starts at `vec`.
+    """
+    rel = _unpack_from("<%dI" % count, buf, vec)
+    return [vec + i * 4 + x for i, x in enumerate(rel)]
+
+
+def _buffer_has_identifier(buf, offset, size_prefixed=False, _FILE_ID=_FILE_ID):
+    """
+    Return true if the buffer starting at `offset` has the schema's file
+    identifier.
+    """
+    if size_prefixed:
+        offset += 4
+    return buf[offset + 4 : offset + 8] == _FILE_ID
+
+
+def _string(buf, off, _U32=_U32):
+    """Read the string referenced by the uoffset at `off`."""
+    off += _U32(buf, off)[0]
+    start = off + 4
+    return bytes(buf[start : start + _U32(buf, off)[0]])
+
 class OperatorType(object):
     Add = 0
     ArgMin = 1
@@ -191,87 +307,10 @@ class OperatorAttrs(object):
     IfAttrs = 39
 
 def OperatorAttrsCreator(unionType, table):
-    from flatbuffers.table import Table
-    if not isinstance(table, Table):
+    if not isinstance(table, _Table):
         return None
-    if unionType == OperatorAttrs().ArgMaxAttrs:
-        return ArgMaxAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().AveragePoolAttrs:
-        return AveragePoolAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().BatchNormalizationAttrs:
-        return BatchNormalizationAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().CastAttrs:
-        return CastAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().ConcatAttrs:
-        return ConcatAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().ConstantOfShapeAttrs:
-        return ConstantOfShapeAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().ConvAttrs:
-        return ConvAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().ConvTransposeAttrs:
-        return ConvTransposeAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().FlattenAttrs:
-        return FlattenAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().GatherAttrs:
-        return GatherAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().GemmAttrs:
-        return GemmAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().GRUAttrs:
-        return GRUAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().LeakyReluAttrs:
-        return LeakyReluAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().LSTMAttrs:
-        return LSTMAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().MaxPoolAttrs:
-        return MaxPoolAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().ReduceMeanAttrs:
-        return ReduceMeanAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().ReshapeAttrs:
-        return ReshapeAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().ResizeAttrs:
-        return ResizeAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().SplitAttrs:
-        return SplitAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().SoftmaxAttrs:
-        return SoftmaxAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().TransposeAttrs:
-        return TransposeAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().ModAttrs:
-        return ModAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().ScatterElementsAttrs:
-        return ScatterElementsAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().OneHotAttrs:
-        return OneHotAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().TopKAttrs:
-        return TopKAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().HardSigmoidAttrs:
-        return HardSigmoidAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().TriluAttrs:
-        return TriluAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().ScatterNDAttrs:
-        return ScatterNDAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().NonMaxSuppressionAttrs:
-        return NonMaxSuppressionAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().LayerNormalizationAttrs:
-        return LayerNormalizationAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().RandomUniformAttrs:
-        return RandomUniformAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().EluAttrs:
-        return EluAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().RandomUniformLikeAttrs:
-        return RandomUniformLikeAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().RandomNormalAttrs:
-        return RandomNormalAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().RandomNormalLikeAttrs:
-        return RandomNormalLikeAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().GatherNDAttrs:
-        return GatherNDAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().GeluAttrs:
-        return GeluAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().EinsumAttrs:
-        return EinsumAttrsT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == OperatorAttrs().IfAttrs:
-        return IfAttrsT.InitFromBuf(table.Bytes, table.Pos)
+    if 0 < unionType < len(_OPERATOR_ATTRS_T):
+        return _OPERATOR_ATTRS_T[unionType].InitFromBuf(table.Bytes, table.Pos)
     return None
 
 
@@ -281,13 +320,10 @@ class Scalar(object):
     FloatScalar = 2
 
 def ScalarCreator(unionType, table):
-    from flatbuffers.table import Table
-    if not isinstance(table, Table):
+    if not isinstance(table, _Table):
         return None
-    if unionType == Scalar().IntScalar:
-        return IntScalarT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == Scalar().FloatScalar:
-        return FloatScalarT.InitFromBuf(table.Bytes, table.Pos)
+    if 0 < unionType < len(_SCALAR_T):
+        return _SCALAR_T[unionType].InitFromBuf(table.Bytes, table.Pos)
     return None
 
 
@@ -311,15 +347,10 @@ class NodeKind(object):
     ValueNode = 3
 
 def NodeKindCreator(unionType, table):
-    from flatbuffers.table import Table
-    if not isinstance(table, Table):
+    if not isinstance(table, _Table):
         return None
-    if unionType == NodeKind().OperatorNode:
-        return OperatorNodeT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == NodeKind().ConstantNode:
-        return ConstantNodeT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == NodeKind().ValueNode:
-        return ValueNodeT.InitFromBuf(table.Bytes, table.Pos)
+    if 0 < unionType < len(_NODE_KIND_T):
+        return _NODE_KIND_T[unionType].InitFromBuf(table.Bytes, table.Pos)
     return None
 
 
@@ -329,13 +360,10 @@ class ConstantData(object):
     IntData = 2
 
 def ConstantDataCreator(unionType, table):
-    from flatbuffers.table import Table
-    if not isinstance(table, Table):
+    if not isinstance(table, _Table):
         return None
-    if unionType == ConstantData().FloatData:
-        return FloatDataT.InitFromBuf(table.Bytes, table.Pos)
-    if unionType == ConstantData().IntData:
-        return IntDataT.InitFromBuf(table.Bytes, table.Pos)
+    if 0 < unionType < len(_CONSTANT_DATA_T):
+        return _CONSTANT_DATA_T[unionType].InitFromBuf(table.Bytes, table.Pos)
     return None
 
 
@@ -345,40 +373,33 @@ class ConstantDataType(object):
 
 
 class ArgMaxAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ArgMaxAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsArgMaxAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ArgMaxAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ArgMaxAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[2](buf, pos)
 
     # ArgMaxAttrs
     def Axis(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
     # ArgMaxAttrs
     def KeepDims(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return bool(self._tab.Get(flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
-        return False
+        o = self._offs[1]
+        return _BOOL(self._buf, o + self._pos)[0] if o else False
 
 def ArgMaxAttrsStart(builder):
     builder.StartObject(2)
@@ -409,7 +430,7 @@ class ArgMaxAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -435,127 +456,120 @@ class ArgMaxAttrsT(object):
 
 
 class AveragePoolAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = AveragePoolAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsAveragePoolAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def AveragePoolAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # AveragePoolAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[5](buf, pos)
 
     # AveragePoolAttrs
     def KernelSize(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # AveragePoolAttrs
     def KernelSizeAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # AveragePoolAttrs
     def KernelSizeLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # AveragePoolAttrs
     def KernelSizeIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         return o == 0
 
     # AveragePoolAttrs
     def AutoPad(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[1]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # AveragePoolAttrs
     def Pads(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # AveragePoolAttrs
     def PadsAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # AveragePoolAttrs
     def PadsLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # AveragePoolAttrs
     def PadsIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         return o == 0
 
     # AveragePoolAttrs
     def Strides(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # AveragePoolAttrs
     def StridesAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # AveragePoolAttrs
     def StridesLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # AveragePoolAttrs
     def StridesIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         return o == 0
 
     # AveragePoolAttrs
     def CountIncludePad(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
-        if o != 0:
-            return bool(self._tab.Get(flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
-        return False
+        o = self._offs[4]
+        return _BOOL(self._buf, o + self._pos)[0] if o else False
 
 def AveragePoolAttrsStart(builder):
     builder.StartObject(5)
 
 def AveragePoolAttrsAddKernelSize(builder, kernelSize):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(kernelSize), 0)
+    builder.PrependUOffsetTRelativeSlot(0, kernelSize, 0)
 
 def AveragePoolAttrsStartKernelSizeVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -564,13 +578,13 @@ def AveragePoolAttrsAddAutoPad(builder, autoPad):
     builder.PrependUint8Slot(1, autoPad, 0)
 
 def AveragePoolAttrsAddPads(builder, pads):
-    builder.PrependUOffsetTRelativeSlot(2, flatbuffers.number_types.UOffsetTFlags.py_type(pads), 0)
+    builder.PrependUOffsetTRelativeSlot(2, pads, 0)
 
 def AveragePoolAttrsStartPadsVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
 
 def AveragePoolAttrsAddStrides(builder, strides):
-    builder.PrependUOffsetTRelativeSlot(3, flatbuffers.number_types.UOffsetTFlags.py_type(strides), 0)
+    builder.PrependUOffsetTRelativeSlot(3, strides, 0)
 
 def AveragePoolAttrsStartStridesVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -605,7 +619,7 @@ class AveragePoolAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -682,33 +696,28 @@ class AveragePoolAttrsT(object):
 
 
 class BatchNormalizationAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = BatchNormalizationAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsBatchNormalizationAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def BatchNormalizationAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # BatchNormalizationAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # BatchNormalizationAttrs
     def Epsilon(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[0]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
 def BatchNormalizationAttrsStart(builder):
     builder.StartObject(1)
@@ -735,7 +744,7 @@ class BatchNormalizationAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -759,33 +768,28 @@ class BatchNormalizationAttrsT(object):
 
 
 class CastAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = CastAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsCastAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def CastAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # CastAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # CastAttrs
     def To(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
 def CastAttrsStart(builder):
     builder.StartObject(1)
@@ -812,7 +816,7 @@ class CastAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -836,33 +840,28 @@ class CastAttrsT(object):
 
 
 class ConcatAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ConcatAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsConcatAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ConcatAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ConcatAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # ConcatAttrs
     def Axis(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
 def ConcatAttrsStart(builder):
     builder.StartObject(1)
@@ -889,7 +888,7 @@ class ConcatAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -913,33 +912,28 @@ class ConcatAttrsT(object):
 
 
 class IntScalar(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = IntScalar()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsIntScalar(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def IntScalarBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # IntScalar
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # IntScalar
     def Value(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
 def IntScalarStart(builder):
     builder.StartObject(1)
@@ -966,7 +960,7 @@ class IntScalarT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -990,33 +984,28 @@ class IntScalarT(object):
 
 
 class FloatScalar(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = FloatScalar()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsFloatScalar(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def FloatScalarBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # FloatScalar
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # FloatScalar
     def Value(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[0]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
 def FloatScalarStart(builder):
     builder.StartObject(1)
@@ -1043,7 +1032,7 @@ class FloatScalarT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -1067,42 +1056,35 @@ class FloatScalarT(object):
 
 
 class ConstantOfShapeAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ConstantOfShapeAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsConstantOfShapeAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ConstantOfShapeAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ConstantOfShapeAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[2](buf, pos)
 
     # ConstantOfShapeAttrs
     def ValueType(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # ConstantOfShapeAttrs
     def Value(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         if o != 0:
-            from flatbuffers.table import Table
-            obj = Table(bytearray(), 0)
-            self._tab.Union(obj, o)
-            return obj
+            x = o + self._pos
+            return _Table(self._buf, x + _U32(self._buf, x)[0])
         return None
 
 def ConstantOfShapeAttrsStart(builder):
@@ -1112,7 +1094,7 @@ def ConstantOfShapeAttrsAddValueType(builder, valueType):
     builder.PrependUint8Slot(0, valueType, 0)
 
 def ConstantOfShapeAttrsAddValue(builder, value):
-    builder.PrependUOffsetTRelativeSlot(1, flatbuffers.number_types.UOffsetTFlags.py_type(value), 0)
+    builder.PrependUOffsetTRelativeSlot(1, value, 0)
 
 def ConstantOfShapeAttrsEnd(builder):
     return builder.EndObject()
@@ -1138,7 +1120,7 @@ class ConstantOfShapeAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -1167,122 +1149,133 @@ class ConstantOfShapeAttrsT(object):
 
 
 class ConvAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ConvAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsConvAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ConvAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ConvAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[5](buf, pos)
 
     # ConvAttrs
     def AutoPad(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # ConvAttrs
     def Pads(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # ConvAttrs
     def PadsAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # ConvAttrs
     def PadsLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # ConvAttrs
     def PadsIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         return o == 0
 
     # ConvAttrs
     def Groups(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[2]
+        return _U32(self._buf, o + self._pos)[0] if o else 0
 
     # ConvAttrs
     def Strides(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # ConvAttrs
     def StridesAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # ConvAttrs
     def StridesLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # ConvAttrs
     def StridesIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         return o == 0
 
     # ConvAttrs
     def Dilations(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
+        o = self._offs[4]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # ConvAttrs
     def DilationsAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
+        o = self._offs[4]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # ConvAttrs
     def DilationsLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
+        o = self._offs[4]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # ConvAttrs
     def DilationsIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
+        o = self._offs[4]
         return o == 0
 
+    # ConvAttrs
+    def All(self):
+        """
+        Return `(auto_pad, pads, groups, strides, dilations)` in one call.
+
+        Vector fields are returned as tuples, or `None` if absent.
+        """
+        buf = self._buf
+        pos = self._pos
+        o_pad, o_pads, o_groups, o_strides, o_dilations = self._offs
+        return (
+            _U8(buf, o_pad + pos)[0] if o_pad else 0,
+            _vector_as_tuple(buf, pos, o_pads, 'I') if o_pads else None,
+            _U32(buf, o_groups + pos)[0] if o_groups else 0,
+            _vector_as_tuple(buf, pos, o_strides, 'I') if o_strides else None,
+            _vector_as_tuple(buf, pos, o_dilations, 'I') if o_dilations else None,
+        )
+
 def ConvAttrsStart(builder):
     builder.StartObject(5)
 
@@ -1290,7 +1283,7 @@ def ConvAttrsAddAutoPad(builder, autoPad):
     builder.PrependUint8Slot(0, autoPad, 0)
 
 def ConvAttrsAddPads(builder, pads):
-    builder.PrependUOffsetTRelativeSlot(1, flatbuffers.number_types.UOffsetTFlags.py_type(pads), 0)
+    builder.PrependUOffsetTRelativeSlot(1, pads, 0)
 
 def ConvAttrsStartPadsVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -1299,13 +1292,13 @@ def ConvAttrsAddGroups(builder, groups):
     builder.PrependUint32Slot(2, groups, 0)
 
 def ConvAttrsAddStrides(builder, strides):
-    builder.PrependUOffsetTRelativeSlot(3, flatbuffers.number_types.UOffsetTFlags.py_type(strides), 0)
+    builder.PrependUOffsetTRelativeSlot(3, strides, 0)
 
 def ConvAttrsStartStridesVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
 
 def ConvAttrsAddDilations(builder, dilations):
-    builder.PrependUOffsetTRelativeSlot(4, flatbuffers.number_types.UOffsetTFlags.py_type(dilations), 0)
+    builder.PrependUOffsetTRelativeSlot(4, dilations, 0)
 
 def ConvAttrsStartDilationsVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -1337,7 +1330,7 @@ class ConvAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -1414,93 +1407,88 @@ class ConvAttrsT(object):
 
 
 class ConvTransposeAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ConvTransposeAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsConvTransposeAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ConvTransposeAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ConvTransposeAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[3](buf, pos)
 
     # ConvTransposeAttrs
     def Strides(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # ConvTransposeAttrs
     def StridesAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # ConvTransposeAttrs
     def StridesLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # ConvTransposeAttrs
     def StridesIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         return o == 0
 
     # ConvTransposeAttrs
     def AutoPad(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 1
+        o = self._offs[1]
+        return _U8(self._buf, o + self._pos)[0] if o else 1
 
     # ConvTransposeAttrs
     def Pads(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # ConvTransposeAttrs
     def PadsAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # ConvTransposeAttrs
     def PadsLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # ConvTransposeAttrs
     def PadsIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         return o == 0
 
 def ConvTransposeAttrsStart(builder):
     builder.StartObject(3)
 
 def ConvTransposeAttrsAddStrides(builder, strides):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(strides), 0)
+    builder.PrependUOffsetTRelativeSlot(0, strides, 0)
 
 def ConvTransposeAttrsStartStridesVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -1509,7 +1497,7 @@ def ConvTransposeAttrsAddAutoPad(builder, autoPad):
     builder.PrependUint8Slot(1, autoPad, 1)
 
 def ConvTransposeAttrsAddPads(builder, pads):
-    builder.PrependUOffsetTRelativeSlot(2, flatbuffers.number_types.UOffsetTFlags.py_type(pads), 0)
+    builder.PrependUOffsetTRelativeSlot(2, pads, 0)
 
 def ConvTransposeAttrsStartPadsVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -1539,7 +1527,7 @@ class ConvTransposeAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -1597,39 +1585,36 @@ class ConvTransposeAttrsT(object):
 
 
 class EinsumAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = EinsumAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsEinsumAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def EinsumAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # EinsumAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # EinsumAttrs
     def Equation(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return _string(self._buf, o + self._pos)
         return None
 
 def EinsumAttrsStart(builder):
     builder.StartObject(1)
 
 def EinsumAttrsAddEquation(builder, equation):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(equation), 0)
+    builder.PrependUOffsetTRelativeSlot(0, equation, 0)
 
 def EinsumAttrsEnd(builder):
     return builder.EndObject()
@@ -1650,7 +1635,7 @@ class EinsumAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -1677,33 +1662,28 @@ class EinsumAttrsT(object):
 
 
 class EluAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = EluAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsEluAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def EluAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # EluAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # EluAttrs
     def Alpha(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[0]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
 def EluAttrsStart(builder):
     builder.StartObject(1)
@@ -1730,7 +1710,7 @@ class EluAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -1754,33 +1734,28 @@ class EluAttrsT(object):
 
 
 class FlattenAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = FlattenAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsFlattenAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def FlattenAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # FlattenAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # FlattenAttrs
     def Axis(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
 def FlattenAttrsStart(builder):
     builder.StartObject(1)
@@ -1807,7 +1782,7 @@ class FlattenAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -1831,40 +1806,33 @@ class FlattenAttrsT(object):
 
 
 class LayerNormalizationAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = LayerNormalizationAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsLayerNormalizationAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def LayerNormalizationAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # LayerNormalizationAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[2](buf, pos)
 
     # LayerNormalizationAttrs
     def Axis(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
     # LayerNormalizationAttrs
     def Epsilon(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[1]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
 def LayerNormalizationAttrsStart(builder):
     builder.StartObject(2)
@@ -1895,7 +1863,7 @@ class LayerNormalizationAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -1921,33 +1889,28 @@ class LayerNormalizationAttrsT(object):
 
 
 class GatherAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = GatherAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsGatherAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def GatherAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # GatherAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # GatherAttrs
     def Axis(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
 def GatherAttrsStart(builder):
     builder.StartObject(1)
@@ -1974,7 +1937,7 @@ class GatherAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -1998,33 +1961,28 @@ class GatherAttrsT(object):
 
 
 class GatherNDAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = GatherNDAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsGatherNDAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def GatherNDAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # GatherNDAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # GatherNDAttrs
     def BatchDims(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
 def GatherNDAttrsStart(builder):
     builder.StartObject(1)
@@ -2051,7 +2009,7 @@ class GatherNDAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -2075,26 +2033,22 @@ class GatherNDAttrsT(object):
 
 
 class GeluAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = GeluAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsGeluAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def GeluAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # GeluAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
 
 def GeluAttrsStart(builder):
     builder.StartObject(0)
@@ -2118,7 +2072,7 @@ class GeluAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -2140,54 +2094,43 @@ class GeluAttrsT(object):
 
 
 class GemmAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = GemmAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsGemmAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def GemmAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # GemmAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[4](buf, pos)
 
     # GemmAttrs
     def Alpha(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[0]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
     # GemmAttrs
     def Beta(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[1]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
     # GemmAttrs
     def TransposeA(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
-        if o != 0:
-            return bool(self._tab.Get(flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
-        return False
+        o = self._offs[2]
+        return _BOOL(self._buf, o + self._pos)[0] if o else False
 
     # GemmAttrs
     def TransposeB(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
-        if o != 0:
-            return bool(self._tab.Get(flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
-        return False
+        o = self._offs[3]
+        return _BOOL(self._buf, o + self._pos)[0] if o else False
 
 def GemmAttrsStart(builder):
     builder.StartObject(4)
@@ -2226,7 +2169,7 @@ class GemmAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -2256,47 +2199,38 @@ class GemmAttrsT(object):
 
 
 class GRUAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = GRUAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsGRUAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def GRUAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # GRUAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[3](buf, pos)
 
     # GRUAttrs
     def Direction(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # GRUAttrs
     def HiddenSize(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[1]
+        return _U32(self._buf, o + self._pos)[0] if o else 0
 
     # GRUAttrs
     def LinearBeforeReset(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
-        if o != 0:
-            return bool(self._tab.Get(flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
-        return False
+        o = self._offs[2]
+        return _BOOL(self._buf, o + self._pos)[0] if o else False
 
 def GRUAttrsStart(builder):
     builder.StartObject(3)
@@ -2331,7 +2265,7 @@ class GRUAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -2359,40 +2293,33 @@ class GRUAttrsT(object):
 
 
 class HardSigmoidAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = HardSigmoidAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsHardSigmoidAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def HardSigmoidAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # HardSigmoidAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[2](buf, pos)
 
     # HardSigmoidAttrs
     def Alpha(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[0]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
     # HardSigmoidAttrs
     def Beta(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[1]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
 def HardSigmoidAttrsStart(builder):
     builder.StartObject(2)
@@ -2423,7 +2350,7 @@ class HardSigmoidAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -2449,44 +2376,43 @@ class HardSigmoidAttrsT(object):
 
 
 class IfAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = IfAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsIfAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def IfAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # IfAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[2](buf, pos)
 
     # IfAttrs
     def ThenBranch(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            x = self._tab.Indirect(o + self._tab.Pos)
+            x = o + self._pos
+            x += _U32(self._buf, x)[0]
             obj = Graph()
-            obj.Init(self._tab.Bytes, x)
+            obj.Init(self._buf, x)
             return obj
         return None
 
     # IfAttrs
     def ElseBranch(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         if o != 0:
-            x = self._tab.Indirect(o + self._tab.Pos)
+            x = o + self._pos
+            x += _U32(self._buf, x)[0]
             obj = Graph()
-            obj.Init(self._tab.Bytes, x)
+            obj.Init(self._buf, x)
             return obj
         return None
 
@@ -2494,10 +2420,10 @@ def IfAttrsStart(builder):
     builder.StartObject(2)
 
 def IfAttrsAddThenBranch(builder, thenBranch):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(thenBranch), 0)
+    builder.PrependUOffsetTRelativeSlot(0, thenBranch, 0)
 
 def IfAttrsAddElseBranch(builder, elseBranch):
-    builder.PrependUOffsetTRelativeSlot(1, flatbuffers.number_types.UOffsetTFlags.py_type(elseBranch), 0)
+    builder.PrependUOffsetTRelativeSlot(1, elseBranch, 0)
 
 def IfAttrsEnd(builder):
     return builder.EndObject()
@@ -2523,7 +2449,7 @@ class IfAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -2557,33 +2483,28 @@ class IfAttrsT(object):
 
 
 class LeakyReluAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = LeakyReluAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsLeakyReluAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def LeakyReluAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # LeakyReluAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # LeakyReluAttrs
     def Alpha(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[0]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
 def LeakyReluAttrsStart(builder):
     builder.StartObject(1)
@@ -2610,7 +2531,7 @@ class LeakyReluAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -2634,40 +2555,33 @@ class LeakyReluAttrsT(object):
 
 
 class LSTMAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = LSTMAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsLSTMAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def LSTMAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # LSTMAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[2](buf, pos)
 
     # LSTMAttrs
     def Direction(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # LSTMAttrs
     def HiddenSize(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[1]
+        return _U32(self._buf, o + self._pos)[0] if o else 0
 
 def LSTMAttrsStart(builder):
     builder.StartObject(2)
@@ -2698,7 +2612,7 @@ class LSTMAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -2724,120 +2638,132 @@ class LSTMAttrsT(object):
 
 
 class MaxPoolAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = MaxPoolAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsMaxPoolAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def MaxPoolAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # MaxPoolAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[4](buf, pos)
 
     # MaxPoolAttrs
     def KernelSize(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # MaxPoolAttrs
     def KernelSizeAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # MaxPoolAttrs
     def KernelSizeLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # MaxPoolAttrs
     def KernelSizeIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         return o == 0
 
     # MaxPoolAttrs
     def AutoPad(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[1]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # MaxPoolAttrs
     def Pads(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # MaxPoolAttrs
     def PadsAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # MaxPoolAttrs
     def PadsLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # MaxPoolAttrs
     def PadsIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         return o == 0
 
     # MaxPoolAttrs
     def Strides(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # MaxPoolAttrs
     def StridesAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # MaxPoolAttrs
     def StridesLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # MaxPoolAttrs
     def StridesIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         return o == 0
 
+    # MaxPoolAttrs
+    def All(self):
+        """
+        Return `(kernel_size, auto_pad, pads, strides)` in one call.
+
+        Vector fields are returned as tuples, or `None` if absent.
+        """
+        buf = self._buf
+        pos = self._pos
+        o_kernel, o_pad, o_pads, o_strides = self._offs
+        return (
+            _vector_as_tuple(buf, pos, o_kernel, 'I') if o_kernel else None,
+            _U8(buf, o_pad + pos)[0] if o_pad else 0,
+            _vector_as_tuple(buf, pos, o_pads, 'I') if o_pads else None,
+            _vector_as_tuple(buf, pos, o_strides, 'I') if o_strides else None,
+        )
+
 def MaxPoolAttrsStart(builder):
     builder.StartObject(4)
 
 def MaxPoolAttrsAddKernelSize(builder, kernelSize):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(kernelSize), 0)
+    builder.PrependUOffsetTRelativeSlot(0, kernelSize, 0)
 
 def MaxPoolAttrsStartKernelSizeVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -2846,13 +2772,13 @@ def MaxPoolAttrsAddAutoPad(builder, autoPad):
     builder.PrependUint8Slot(1, autoPad, 0)
 
 def MaxPoolAttrsAddPads(builder, pads):
-    builder.PrependUOffsetTRelativeSlot(2, flatbuffers.number_types.UOffsetTFlags.py_type(pads), 0)
+    builder.PrependUOffsetTRelativeSlot(2, pads, 0)
 
 def MaxPoolAttrsStartPadsVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
 
 def MaxPoolAttrsAddStrides(builder, strides):
-    builder.PrependUOffsetTRelativeSlot(3, flatbuffers.number_types.UOffsetTFlags.py_type(strides), 0)
+    builder.PrependUOffsetTRelativeSlot(3, strides, 0)
 
 def MaxPoolAttrsStartStridesVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -2883,7 +2809,7 @@ class MaxPoolAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -2958,33 +2884,28 @@ class MaxPoolAttrsT(object):
 
 
 class ModAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ModAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsModAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ModAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ModAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # ModAttrs
     def Fmod(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return bool(self._tab.Get(flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
-        return False
+        o = self._offs[0]
+        return _BOOL(self._buf, o + self._pos)[0] if o else False
 
 def ModAttrsStart(builder):
     builder.StartObject(1)
@@ -3011,7 +2932,7 @@ class ModAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -3035,33 +2956,28 @@ class ModAttrsT(object):
 
 
 class NonMaxSuppressionAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = NonMaxSuppressionAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsNonMaxSuppressionAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def NonMaxSuppressionAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # NonMaxSuppressionAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # NonMaxSuppressionAttrs
     def BoxOrder(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
 def NonMaxSuppressionAttrsStart(builder):
     builder.StartObject(1)
@@ -3088,7 +3004,7 @@ class NonMaxSuppressionAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -3112,33 +3028,28 @@ class NonMaxSuppressionAttrsT(object):
 
 
 class OneHotAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = OneHotAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsOneHotAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def OneHotAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # OneHotAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # OneHotAttrs
     def Axis(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
 def OneHotAttrsStart(builder):
     builder.StartObject(1)
@@ -3165,7 +3076,7 @@ class OneHotAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -3189,73 +3100,64 @@ class OneHotAttrsT(object):
 
 
 class RandomNormalAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = RandomNormalAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsRandomNormalAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def RandomNormalAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # RandomNormalAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[4](buf, pos)
 
     # RandomNormalAttrs
     def Mean(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[0]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
     # RandomNormalAttrs
     def Scale(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[1]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
     # RandomNormalAttrs
     def Seed(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return None
+        o = self._offs[2]
+        return _F32(self._buf, o + self._pos)[0] if o else None
 
     # RandomNormalAttrs
     def Shape(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # RandomNormalAttrs
     def ShapeAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # RandomNormalAttrs
     def ShapeLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # RandomNormalAttrs
     def ShapeIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         return o == 0
 
 def RandomNormalAttrsStart(builder):
@@ -3271,7 +3173,7 @@ def RandomNormalAttrsAddSeed(builder, seed):
     builder.PrependFloat32Slot(2, seed, None)
 
 def RandomNormalAttrsAddShape(builder, shape):
-    builder.PrependUOffsetTRelativeSlot(3, flatbuffers.number_types.UOffsetTFlags.py_type(shape), 0)
+    builder.PrependUOffsetTRelativeSlot(3, shape, 0)
 
 def RandomNormalAttrsStartShapeVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -3302,7 +3204,7 @@ class RandomNormalAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -3347,47 +3249,38 @@ class RandomNormalAttrsT(object):
 
 
 class RandomNormalLikeAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = RandomNormalLikeAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsRandomNormalLikeAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def RandomNormalLikeAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # RandomNormalLikeAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[3](buf, pos)
 
     # RandomNormalLikeAttrs
     def Mean(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[0]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
     # RandomNormalLikeAttrs
     def Scale(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[1]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
     # RandomNormalLikeAttrs
     def Seed(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return None
+        o = self._offs[2]
+        return _F32(self._buf, o + self._pos)[0] if o else None
 
 def RandomNormalLikeAttrsStart(builder):
     builder.StartObject(3)
@@ -3422,7 +3315,7 @@ class RandomNormalLikeAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -3450,80 +3343,71 @@ class RandomNormalLikeAttrsT(object):
 
 
 class RandomUniformAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = RandomUniformAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsRandomUniformAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def RandomUniformAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # RandomUniformAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[4](buf, pos)
 
     # RandomUniformAttrs
     def Shape(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # RandomUniformAttrs
     def ShapeAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # RandomUniformAttrs
     def ShapeLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # RandomUniformAttrs
     def ShapeIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         return o == 0
 
     # RandomUniformAttrs
     def High(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[1]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
     # RandomUniformAttrs
     def Low(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[2]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
     # RandomUniformAttrs
     def Seed(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return None
+        o = self._offs[3]
+        return _F32(self._buf, o + self._pos)[0] if o else None
 
 def RandomUniformAttrsStart(builder):
     builder.StartObject(4)
 
 def RandomUniformAttrsAddShape(builder, shape):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(shape), 0)
+    builder.PrependUOffsetTRelativeSlot(0, shape, 0)
 
 def RandomUniformAttrsStartShapeVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -3563,7 +3447,7 @@ class RandomUniformAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -3608,47 +3492,38 @@ class RandomUniformAttrsT(object):
 
 
 class RandomUniformLikeAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = RandomUniformLikeAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsRandomUniformLikeAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def RandomUniformLikeAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # RandomUniformLikeAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[3](buf, pos)
 
     # RandomUniformLikeAttrs
     def High(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[0]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
     # RandomUniformLikeAttrs
     def Low(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return 0.0
+        o = self._offs[1]
+        return _F32(self._buf, o + self._pos)[0] if o else 0.0
 
     # RandomUniformLikeAttrs
     def Seed(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, o + self._tab.Pos)
-        return None
+        o = self._offs[2]
+        return _F32(self._buf, o + self._pos)[0] if o else None
 
 def RandomUniformLikeAttrsStart(builder):
     builder.StartObject(3)
@@ -3683,7 +3558,7 @@ class RandomUniformLikeAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -3711,66 +3586,71 @@ class RandomUniformLikeAttrsT(object):
 
 
 class ReduceMeanAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs', '_axes_np']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ReduceMeanAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsReduceMeanAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ReduceMeanAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ReduceMeanAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[2](buf, pos)
+        self._axes_np = None
 
     # ReduceMeanAttrs
     def Axes(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _I32(self._buf, a + j * 4)[0]
         return 0
 
     # ReduceMeanAttrs
     def AxesAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        if self._axes_np is None:
+            o = self._offs[0]
+            if o == 0:
+                return 0
+            self._axes_np = _vector_as_numpy(self._buf, self._pos, o, '<i4')
+        return self._axes_np
+
+    # ReduceMeanAttrs
+    def AxesAsTuple(self):
+        o = self._offs[0]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Int32Flags, o)
-        return 0
+            return _vector_as_tuple(self._buf, self._pos, o, 'i')
+        return ()
 
     # ReduceMeanAttrs
     def AxesLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # ReduceMeanAttrs
     def AxesIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         return o == 0
 
     # ReduceMeanAttrs
     def KeepDims(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return bool(self._tab.Get(flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
-        return False
+        o = self._offs[1]
+        return _BOOL(self._buf, o + self._pos)[0] if o else False
 
 def ReduceMeanAttrsStart(builder):
     builder.StartObject(2)
 
 def ReduceMeanAttrsAddAxes(builder, axes):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(axes), 0)
+    builder.PrependUOffsetTRelativeSlot(0, axes, 0)
 
 def ReduceMeanAttrsStartAxesVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -3802,7 +3682,7 @@ class ReduceMeanAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -3843,33 +3723,28 @@ class ReduceMeanAttrsT(object):
 
 
 class ReshapeAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ReshapeAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsReshapeAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ReshapeAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ReshapeAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # ReshapeAttrs
     def AllowZero(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return bool(self._tab.Get(flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
-        return False
+        o = self._offs[0]
+        return _BOOL(self._buf, o + self._pos)[0] if o else False
 
 def ReshapeAttrsStart(builder):
     builder.StartObject(1)
@@ -3896,7 +3771,7 @@ class ReshapeAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -3920,47 +3795,38 @@ class ReshapeAttrsT(object):
 
 
 class ResizeAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ResizeAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsResizeAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ResizeAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ResizeAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[3](buf, pos)
 
     # ResizeAttrs
     def Mode(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # ResizeAttrs
     def CoordMode(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[1]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # ResizeAttrs
     def NearestMode(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[2]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
 def ResizeAttrsStart(builder):
     builder.StartObject(3)
@@ -3995,7 +3861,7 @@ class ResizeAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -4023,40 +3889,33 @@ class ResizeAttrsT(object):
 
 
 class ScatterElementsAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ScatterElementsAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsScatterElementsAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ScatterElementsAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ScatterElementsAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[2](buf, pos)
 
     # ScatterElementsAttrs
     def Axis(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
     # ScatterElementsAttrs
     def Reduction(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[1]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
 def ScatterElementsAttrsStart(builder):
     builder.StartObject(2)
@@ -4087,7 +3946,7 @@ class ScatterElementsAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -4113,33 +3972,28 @@ class ScatterElementsAttrsT(object):
 
 
 class ScatterNDAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ScatterNDAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsScatterNDAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ScatterNDAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ScatterNDAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # ScatterNDAttrs
     def Reduction(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
 def ScatterNDAttrsStart(builder):
     builder.StartObject(1)
@@ -4166,7 +4020,7 @@ class ScatterNDAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -4190,33 +4044,28 @@ class ScatterNDAttrsT(object):
 
 
 class SoftmaxAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = SoftmaxAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsSoftmaxAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def SoftmaxAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # SoftmaxAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # SoftmaxAttrs
     def Axis(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
 def SoftmaxAttrsStart(builder):
     builder.StartObject(1)
@@ -4243,7 +4092,7 @@ class SoftmaxAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -4267,33 +4116,28 @@ class SoftmaxAttrsT(object):
 
 
 class SplitAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = SplitAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsSplitAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def SplitAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # SplitAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # SplitAttrs
     def Axis(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
 def SplitAttrsStart(builder):
     builder.StartObject(1)
@@ -4320,7 +4164,7 @@ class SplitAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -4344,47 +4188,38 @@ class SplitAttrsT(object):
 
 
 class TopKAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = TopKAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsTopKAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def TopKAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # TopKAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[3](buf, pos)
 
     # TopKAttrs
     def Axis(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
     # TopKAttrs
     def Largest(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return bool(self._tab.Get(flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
-        return False
+        o = self._offs[1]
+        return _BOOL(self._buf, o + self._pos)[0] if o else False
 
     # TopKAttrs
     def Sorted(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
-        if o != 0:
-            return bool(self._tab.Get(flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
-        return False
+        o = self._offs[2]
+        return _BOOL(self._buf, o + self._pos)[0] if o else False
 
 def TopKAttrsStart(builder):
     builder.StartObject(3)
@@ -4419,7 +4254,7 @@ class TopKAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -4447,59 +4282,56 @@ class TopKAttrsT(object):
 
 
 class TransposeAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = TransposeAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsTransposeAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def TransposeAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # TransposeAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # TransposeAttrs
     def Perm(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # TransposeAttrs
     def PermAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # TransposeAttrs
     def PermLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # TransposeAttrs
     def PermIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         return o == 0
 
 def TransposeAttrsStart(builder):
     builder.StartObject(1)
 
 def TransposeAttrsAddPerm(builder, perm):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(perm), 0)
+    builder.PrependUOffsetTRelativeSlot(0, perm, 0)
 
 def TransposeAttrsStartPermVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -4527,7 +4359,7 @@ class TransposeAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -4566,33 +4398,28 @@ class TransposeAttrsT(object):
 
 
 class TriluAttrs(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = TriluAttrs()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsTriluAttrs(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def TriluAttrsBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # TriluAttrs
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # TriluAttrs
     def Upper(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return bool(self._tab.Get(flatbuffers.number_types.BoolFlags, o + self._tab.Pos))
-        return False
+        o = self._offs[0]
+        return _BOOL(self._buf, o + self._pos)[0] if o else False
 
 def TriluAttrsStart(builder):
     builder.StartObject(1)
@@ -4619,7 +4446,7 @@ class TriluAttrsT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -4643,103 +4470,127 @@ class TriluAttrsT(object):
 
 
 class OperatorNode(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs', '_inputs_np']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = OperatorNode()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsOperatorNode(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def OperatorNodeBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # OperatorNode
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[5](buf, pos)
+        self._inputs_np = None
 
     # OperatorNode
     def Type(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # OperatorNode
     def AttrsType(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[1]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # OperatorNode
     def Attrs(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            from flatbuffers.table import Table
-            obj = Table(bytearray(), 0)
-            self._tab.Union(obj, o)
-            return obj
+            x = o + self._pos
+            return _Table(self._buf, x + _U32(self._buf, x)[0])
         return None
 
+    # OperatorNode
+    def TypedAttrs(self):
+        """
+        Return the attributes as an instance of the reader class selected by
+        `AttrsType()`, or `None` if the operator has no attributes.
+        """
+        o = self._offs[2]
+        attrs_type = self.AttrsType()
+        if o == 0 or not 0 < attrs_type < len(_OPERATOR_ATTRS):
+            return None
+        cls = _OPERATOR_ATTRS[attrs_type]
+        x = o + self._pos
+        obj = cls.__new__(cls)
+        obj.Init(self._buf, x + _U32(self._buf, x)[0])
+        return obj
+
     # OperatorNode
     def Inputs(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _I32(self._buf, a + j * 4)[0]
         return 0
 
     # OperatorNode
     def InputsAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        if self._inputs_np is None:
+            o = self._offs[3]
+            if o == 0:
+                return 0
+            self._inputs_np = _vector_as_numpy(self._buf, self._pos, o, '<i4')
+        return self._inputs_np
+
+    # OperatorNode
+    def InputsAsTuple(self):
+        o = self._offs[3]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Int32Flags, o)
-        return 0
+            return _vector_as_tuple(self._buf, self._pos, o, 'i')
+        return ()
 
     # OperatorNode
     def InputsLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # OperatorNode
     def InputsIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         return o == 0
 
     # OperatorNode
     def Outputs(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
+        o = self._offs[4]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _I32(self._buf, a + j * 4)[0]
         return 0
 
     # OperatorNode
     def OutputsAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
+        o = self._offs[4]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Int32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<i4')
         return 0
 
+    # OperatorNode
+    def OutputsAsTuple(self):
+        o = self._offs[4]
+        if o != 0:
+            return _vector_as_tuple(self._buf, self._pos, o, 'i')
+        return ()
+
     # OperatorNode
     def OutputsLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
+        o = self._offs[4]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # OperatorNode
     def OutputsIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
+        o = self._offs[4]
         return o == 0
 
 def OperatorNodeStart(builder):
@@ -4752,16 +4603,16 @@ def OperatorNodeAddAttrsType(builder, attrsType):
     builder.PrependUint8Slot(1, attrsType, 0)
 
 def OperatorNodeAddAttrs(builder, attrs):
-    builder.PrependUOffsetTRelativeSlot(2, flatbuffers.number_types.UOffsetTFlags.py_type(attrs), 0)
+    builder.PrependUOffsetTRelativeSlot(2, attrs, 0)
 
 def OperatorNodeAddInputs(builder, inputs):
-    builder.PrependUOffsetTRelativeSlot(3, flatbuffers.number_types.UOffsetTFlags.py_type(inputs), 0)
+    builder.PrependUOffsetTRelativeSlot(3, inputs, 0)
 
 def OperatorNodeStartInputsVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
 
 def OperatorNodeAddOutputs(builder, outputs):
-    builder.PrependUOffsetTRelativeSlot(4, flatbuffers.number_types.UOffsetTFlags.py_type(outputs), 0)
+    builder.PrependUOffsetTRelativeSlot(4, outputs, 0)
 
 def OperatorNodeStartOutputsVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -4793,7 +4644,7 @@ class OperatorNodeT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -4858,59 +4709,59 @@ class OperatorNodeT(object):
 
 
 class FloatData(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs', '_data_np']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = FloatData()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsFloatData(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def FloatDataBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # FloatData
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
+        self._data_np = None
 
     # FloatData
     def Data(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Float32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _F32(self._buf, a + j * 4)[0]
         return 0
 
     # FloatData
     def DataAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Float32Flags, o)
-        return 0
+        if self._data_np is None:
+            o = self._offs[0]
+            if o == 0:
+                return 0
+            self._data_np = _vector_as_numpy(self._buf, self._pos, o, '<f4')
+        return self._data_np
 
     # FloatData
     def DataLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # FloatData
     def DataIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         return o == 0
 
 def FloatDataStart(builder):
     builder.StartObject(1)
 
 def FloatDataAddData(builder, data):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(data), 0)
+    builder.PrependUOffsetTRelativeSlot(0, data, 0)
 
 def FloatDataStartDataVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -4938,7 +4789,7 @@ class FloatDataT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -4977,59 +4828,59 @@ class FloatDataT(object):
 
 
 class IntData(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs', '_data_np']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = IntData()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsIntData(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def IntDataBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # IntData
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
+        self._data_np = None
 
     # IntData
     def Data(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _I32(self._buf, a + j * 4)[0]
         return 0
 
     # IntData
     def DataAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Int32Flags, o)
-        return 0
+        if self._data_np is None:
+            o = self._offs[0]
+            if o == 0:
+                return 0
+            self._data_np = _vector_as_numpy(self._buf, self._pos, o, '<i4')
+        return self._data_np
 
     # IntData
     def DataLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # IntData
     def DataIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         return o == 0
 
 def IntDataStart(builder):
     builder.StartObject(1)
 
 def IntDataAddData(builder, data):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(data), 0)
+    builder.PrependUOffsetTRelativeSlot(0, data, 0)
 
 def IntDataStartDataVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -5057,7 +4908,7 @@ class IntDataT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -5096,90 +4947,153 @@ class IntDataT(object):
 
 
 class ConstantNode(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs', '_shape_np']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ConstantNode()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsConstantNode(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ConstantNodeBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ConstantNode
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[5](buf, pos)
+        self._shape_np = None
 
     # ConstantNode
     def Shape(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # ConstantNode
     def ShapeAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        if self._shape_np is None:
+            o = self._offs[0]
+            if o == 0:
+                return 0
+            self._shape_np = _vector_as_numpy(self._buf, self._pos, o, '<u4')
+        return self._shape_np
+
+    # ConstantNode
+    def ShapeAsTuple(self):
+        o = self._offs[0]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
-        return 0
+            return _vector_as_tuple(self._buf, self._pos, o, 'I')
+        return ()
+
+    # ConstantNode
+    def ShapeProduct(self):
+        """Return the number of elements in this constant, without creating an array."""
+        o = self._offs[0]
+        if o != 0:
+            return math.prod(_vector_as_tuple(self._buf, self._pos, o, 'I'))
+        return 1
 
     # ConstantNode
     def ShapeLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # ConstantNode
     def ShapeIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         return o == 0
 
     # ConstantNode
     def DataType(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[1]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # ConstantNode
     def Data(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            from flatbuffers.table import Table
-            obj = Table(bytearray(), 0)
-            self._tab.Union(obj, o)
-            return obj
+            x = o + self._pos
+            return _Table(self._buf, x + _U32(self._buf, x)[0])
         return None
 
     # ConstantNode
     def Dtype(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint16Flags, o + self._tab.Pos)
-        return None
+        o = self._offs[3]
+        return _U16(self._buf, o + self._pos)[0] if o else None
 
     # ConstantNode
     def DataOffset(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint64Flags, o + self._tab.Pos)
-        return None
+        o = self._offs[4]
+        return _U64(self._buf, o + self._pos)[0] if o else None
+
+    # ConstantNode
+    def Load(self):
+        """
+        Read the shape, data type and inline data of this constant in one pass.
+
+        Returns a `(shape, dtype, data)` tuple. `shape` is a tuple of ints.
+        `dtype` is a `ConstantDataType` value, or `None` if it is unknown.
+        `data` is a NumPy array which views the inline data, or `None` if the
+        data is stored in the model's tensor data segment (see `DataOffset`).
+        """
+        o_shape, o_data_type, o_data, o_dtype, _ = self._offs
+        buf = self._buf
+        pos = self._pos
+        shape = _vector_as_tuple(buf, pos, o_shape, 'I') if o_shape else ()
+        data_type = _U8(buf, o_data_type + pos)[0] if o_data_type else 0
+        if not 0 < data_type < len(_CONSTANT_DATA_NUMPY):
+            data_type = 0
+        if o_dtype:
+            dtype = _U16(buf, o_dtype + pos)[0]
+        else:
+            dtype = _CONSTANT_DATA_DTYPE[data_type]
+        data = None
+        if o_data and data_type:
+            x = o_data + pos
+            x += _U32(buf, x)[0]
+            o = _FIELD_OFFSETS[1](buf, x)[0]
+            if o:
+                data = _vector_as_numpy(buf, x, o, _CONSTANT_DATA_NUMPY[data_type])
+        return shape, dtype, data
+
+    # ConstantNode
+    def DataAsNumpy(self, tensor_data=None):
+        """
+        Return the elements of this constant as a flat NumPy array.
+
+        The array views the stored data without copying or converting it, so
+        its type matches the element type stored in the model.
+
+        :param tensor_data:
+            Buffer containing the model's tensor data segment. This is required
+            if the data is not stored inline (see `DataOffset`).
+        """
+        shape, dtype, data = self.Load()
+        if data is not None:
+            return data
+        data_offset = self.DataOffset()
+        if data_offset is None:
+            return None
+        if dtype is None or not 0 <= dtype < len(_CONSTANT_DATA_TYPE_NUMPY):
+            raise ValueError("Unsupported constant data type {}".format(dtype))
+        if tensor_data is None:
+            raise ValueError("Tensor data segment is required to read external data")
+        return _GetVectorAsNumpy(
+            _CONSTANT_DATA_TYPE_NUMPY[dtype], tensor_data, math.prod(shape), data_offset
+        )
 
 def ConstantNodeStart(builder):
     builder.StartObject(5)
 
 def ConstantNodeAddShape(builder, shape):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(shape), 0)
+    builder.PrependUOffsetTRelativeSlot(0, shape, 0)
 
 def ConstantNodeStartShapeVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -5188,7 +5102,7 @@ def ConstantNodeAddDataType(builder, dataType):
     builder.PrependUint8Slot(1, dataType, 0)
 
 def ConstantNodeAddData(builder, data):
-    builder.PrependUOffsetTRelativeSlot(2, flatbuffers.number_types.UOffsetTFlags.py_type(data), 0)
+    builder.PrependUOffsetTRelativeSlot(2, data, 0)
 
 def ConstantNodeAddDtype(builder, dtype):
     builder.PrependUint16Slot(3, dtype, None)
@@ -5223,7 +5137,7 @@ class ConstantNodeT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -5273,39 +5187,34 @@ class ConstantNodeT(object):
 
 
 class Dim(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = Dim()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsDim(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def DimBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # Dim
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[2](buf, pos)
 
     # Dim
     def Value(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _U32(self._buf, o + self._pos)[0] if o else 0
 
     # Dim
     def Name(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return _string(self._buf, o + self._pos)
         return None
 
 def DimStart(builder):
@@ -5315,7 +5224,7 @@ def DimAddValue(builder, value):
     builder.PrependUint32Slot(0, value, 0)
 
 def DimAddName(builder, name):
-    builder.PrependUOffsetTRelativeSlot(1, flatbuffers.number_types.UOffsetTFlags.py_type(name), 0)
+    builder.PrependUOffsetTRelativeSlot(1, name, 0)
 
 def DimEnd(builder):
     return builder.EndObject()
@@ -5337,7 +5246,7 @@ class DimT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -5366,56 +5275,51 @@ class DimT(object):
 
 
 class ValueNode(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = ValueNode()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsValueNode(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ValueNodeBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # ValueNode
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[1](buf, pos)
 
     # ValueNode
     def Shape(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            x = self._tab.Vector(o)
-            x += flatbuffers.number_types.UOffsetTFlags.py_type(j) * 4
-            x = self._tab.Indirect(x)
+            x = _vector(self._buf, self._pos, o) + j * 4
             obj = Dim()
-            obj.Init(self._tab.Bytes, x)
+            obj.Init(self._buf, x + _U32(self._buf, x)[0])
             return obj
         return None
 
     # ValueNode
     def ShapeLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # ValueNode
     def ShapeIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         return o == 0
 
 def ValueNodeStart(builder):
     builder.StartObject(1)
 
 def ValueNodeAddShape(builder, shape):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(shape), 0)
+    builder.PrependUOffsetTRelativeSlot(0, shape, 0)
 
 def ValueNodeStartShapeVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -5443,7 +5347,7 @@ class ValueNodeT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -5483,62 +5387,55 @@ class ValueNodeT(object):
 
 
 class Node(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = Node()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsNode(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def NodeBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # Node
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[3](buf, pos)
 
     # Node
     def Name(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return _string(self._buf, o + self._pos)
         return None
 
     # Node
     def DataType(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Uint8Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[1]
+        return _U8(self._buf, o + self._pos)[0] if o else 0
 
     # Node
     def Data(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            from flatbuffers.table import Table
-            obj = Table(bytearray(), 0)
-            self._tab.Union(obj, o)
-            return obj
+            x = o + self._pos
+            return _Table(self._buf, x + _U32(self._buf, x)[0])
         return None
 
 def NodeStart(builder):
     builder.StartObject(3)
 
 def NodeAddName(builder, name):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(name), 0)
+    builder.PrependUOffsetTRelativeSlot(0, name, 0)
 
 def NodeAddDataType(builder, dataType):
     builder.PrependUint8Slot(1, dataType, 0)
 
 def NodeAddData(builder, data):
-    builder.PrependUOffsetTRelativeSlot(2, flatbuffers.number_types.UOffsetTFlags.py_type(data), 0)
+    builder.PrependUOffsetTRelativeSlot(2, data, 0)
 
 def NodeEnd(builder):
     return builder.EndObject()
@@ -5565,7 +5462,7 @@ class NodeT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -5599,155 +5496,281 @@ class NodeT(object):
 
 
 class Graph(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs', '_nodes_vec', '_nodes_len']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = Graph()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsGraph(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def GraphBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # Graph
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[4](buf, pos)
+        # Nodes are the most frequently accessed field, so resolve the vector
+        # once here.
+        o = self._offs[0]
+        self._nodes_vec = _vector(buf, pos, o) if o else 0
+        self._nodes_len = _vector_len(buf, pos, o) if o else 0
 
     # Graph
     def Nodes(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            x = self._tab.Vector(o)
-            x += flatbuffers.number_types.UOffsetTFlags.py_type(j) * 4
-            x = self._tab.Indirect(x)
+        if self._offs[0] != 0:
+            buf = self._buf
+            x = self._nodes_vec + j * 4
             obj = Node()
-            obj.Init(self._tab.Bytes, x)
+            obj.Init(buf, x + _U32(buf, x)[0])
             return obj
         return None
 
     # Graph
     def NodesLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.VectorLen(o)
-        return 0
+        return self._nodes_len
 
     # Graph
     def NodesIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         return o == 0
 
+    # Graph
+    def NodesAsList(self):
+        """
+        Return readers for all nodes in the graph.
+
+        This is equivalent to calling `Nodes(i)` for each index, without the
+        per-node method call.
+        """
+        buf = self._buf
+        nodes = []
+        for x in _table_positions(buf, self._nodes_vec, self._nodes_len):
+            obj = Node()
+            obj.Init(buf, x)
+            nodes.append(obj)
+        return nodes
+
+    # Graph
+    def NodesOffsets(self):
+        """
+        Return the absolute buffer positions of all nodes as a NumPy array.
+
+        The relative offsets in the nodes vector are resolved in one vectorized
+        step. A node can be read with `Node.Init(buf, pos)` using a position
+        from the returned array.
+        """
+        vec = self._nodes_vec
+        n = self._nodes_len
+        rel = _GetVectorAsNumpy('<u4', self._buf, n, vec).astype(np.int64)
+        return rel + np.arange(vec, vec + n * 4, 4, dtype=np.int64)
+
+    # Graph
+    def NodesRawView(self):
+        """
+        Return a zero-copy view of the bytes of the nodes vector.
+
+        The view contains the vector's little-endian uint32 offsets. Each offset
+        is relative to its own position in the buffer. The length prefix is not
+        included.
+        """
+        vec = self._nodes_vec
+        return memoryview(self._buf)[vec : vec + self._nodes_len * 4]
+
+    # Graph
+    def NodeNamesAsList(self):
+        """
+        Return the `Name` of every node, without creating node readers.
+
+        Names are returned as bytes, or `None` for unnamed nodes.
+        """
+        buf = self._buf
+        read_offsets = _FIELD_OFFSETS[1]
+        names = []
+        for x in _table_positions(buf, self._nodes_vec, self._nodes_len):
+            (o_name,) = read_offsets(buf, x)
+            names.append(_string(buf, x + o_name) if o_name else None)
+        return names
+
+    # Graph
+    def NodeDataTypesAsList(self):
+        """
+        Return the `DataType` (a `NodeKind` value) of every node, without
+        creating node readers.
+        """
+        buf = self._buf
+        read_offsets = _FIELD_OFFSETS[2]
+        kinds = []
+        for x in _table_positions(buf, self._nodes_vec, self._nodes_len):
+            _, o_kind = read_offsets(buf, x)
+            kinds.append(_U8(buf, x + o_kind)[0] if o_kind else 0)
+        return kinds
+
+    # Graph
+    def ConstantsAsNumpy(self, tensor_data=None):
+        """
+        Return the data of every constant node in one pass over the nodes.
+
+        Returns a list of `(index, data)` tuples, where `index` is the node's
+        index in `Nodes` and `data` is the result of
+        `ConstantNode.DataAsNumpy(tensor_data)`, a flat view of the stored
+        elements.
+
+        :param tensor_data:
+            Buffer containing the model's tensor data segment. This is required
+            if any constant's data is not stored inline.
+        """
+        buf = self._buf
+        read_offsets = _FIELD_OFFSETS[3]
+        constants = []
+        for i, x in enumerate(_table_positions(buf, self._nodes_vec, self._nodes_len)):
+            _, o_kind, o_data = read_offsets(buf, x)
+            if not o_kind or _U8(buf, x + o_kind)[0] != NodeKind.ConstantNode or not o_data:
+                continue
+            x += o_data
+            node = ConstantNode()
+            node.Init(buf, x + _U32(buf, x)[0])
+            constants.append((i, node.DataAsNumpy(tensor_data)))
+        return constants
+
+    # Graph
+    def OperatorTypesAsNumpy(self):
+        """
+        Read the types of all operator nodes into dense arrays in one pass.
+
+        Returns a `(indices, types, attrs_types)` tuple of NumPy arrays. For
+        each operator node, `indices` holds its index in `Nodes`, and `types`
+        and `attrs_types` hold its `OperatorType` and `OperatorAttrs` values.
+        """
+        indices = []
+        types = []
+        attrs_types = []
+        buf = self._buf
+        read_node_offsets = _FIELD_OFFSETS[3]
+        read_operator_offsets = _FIELD_OFFSETS[2]
+        for i, x in enumerate(_table_positions(buf, self._nodes_vec, self._nodes_len)):
+            _, o_kind, o_data = read_node_offsets(buf, x)
+            if not o_kind or _U8(buf, x + o_kind)[0] != NodeKind.OperatorNode or not o_data:
+                continue
+            x += o_data
+            x += _U32(buf, x)[0]
+            o_type, o_attrs_type = read_operator_offsets(buf, x)
+            indices.append(i)
+            types.append(_U8(buf, x + o_type)[0] if o_type else 0)
+            attrs_types.append(_U8(buf, x + o_attrs_type)[0] if o_attrs_type else 0)
+        return (
+            np.array(indices, dtype=np.uint32),
+            np.array(types, dtype=np.uint8),
+            np.array(attrs_types, dtype=np.uint8),
+        )
+
     # Graph
     def Inputs(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # Graph
     def InputsAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # Graph
     def InputsLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # Graph
     def InputsIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         return o == 0
 
     # Graph
     def Outputs(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # Graph
     def OutputsAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # Graph
     def OutputsLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # Graph
     def OutputsIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         return o == 0
 
     # Graph
     def Captures(self, j):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            a = self._tab.Vector(o)
-            return self._tab.Get(flatbuffers.number_types.Uint32Flags, a + flatbuffers.number_types.UOffsetTFlags.py_type(j * 4))
+            a = _vector(self._buf, self._pos, o)
+            return _U32(self._buf, a + j * 4)[0]
         return 0
 
     # Graph
     def CapturesAsNumpy(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.GetVectorAsNumpy(flatbuffers.number_types.Uint32Flags, o)
+            return _vector_as_numpy(self._buf, self._pos, o, '<u4')
         return 0
 
     # Graph
     def CapturesLength(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.VectorLen(o)
+            return _vector_len(self._buf, self._pos, o)
         return 0
 
     # Graph
     def CapturesIsNone(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         return o == 0
 
 def GraphStart(builder):
     builder.StartObject(4)
 
 def GraphAddNodes(builder, nodes):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(nodes), 0)
+    builder.PrependUOffsetTRelativeSlot(0, nodes, 0)
 
 def GraphStartNodesVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
 
 def GraphAddInputs(builder, inputs):
-    builder.PrependUOffsetTRelativeSlot(1, flatbuffers.number_types.UOffsetTFlags.py_type(inputs), 0)
+    builder.PrependUOffsetTRelativeSlot(1, inputs, 0)
 
 def GraphStartInputsVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
 
 def GraphAddOutputs(builder, outputs):
-    builder.PrependUOffsetTRelativeSlot(2, flatbuffers.number_types.UOffsetTFlags.py_type(outputs), 0)
+    builder.PrependUOffsetTRelativeSlot(2, outputs, 0)
 
 def GraphStartOutputsVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
 
 def GraphAddCaptures(builder, captures):
-    builder.PrependUOffsetTRelativeSlot(3, flatbuffers.number_types.UOffsetTFlags.py_type(captures), 0)
+    builder.PrependUOffsetTRelativeSlot(3, captures, 0)
 
 def GraphStartCapturesVector(builder, numElems):
     return builder.StartVector(4, numElems, 4)
@@ -5778,7 +5801,7 @@ class GraphT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -5869,109 +5892,106 @@ class GraphT(object):
 
 
 class Metadata(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = Metadata()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsMetadata(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def MetadataBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # Metadata
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[8](buf, pos)
 
     # Metadata
     def OnnxHash(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
+        o = self._offs[0]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return _string(self._buf, o + self._pos)
         return None
 
     # Metadata
     def Description(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return _string(self._buf, o + self._pos)
         return None
 
     # Metadata
     def License(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return _string(self._buf, o + self._pos)
         return None
 
     # Metadata
     def Commit(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(10))
+        o = self._offs[3]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return _string(self._buf, o + self._pos)
         return None
 
     # Metadata
     def CodeRepository(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(12))
+        o = self._offs[4]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return _string(self._buf, o + self._pos)
         return None
 
     # Metadata
     def ModelRepository(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(14))
+        o = self._offs[5]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return _string(self._buf, o + self._pos)
         return None
 
     # Metadata
     def RunId(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(16))
+        o = self._offs[6]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return _string(self._buf, o + self._pos)
         return None
 
     # Metadata
     def RunUrl(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(18))
+        o = self._offs[7]
         if o != 0:
-            return self._tab.String(o + self._tab.Pos)
+            return _string(self._buf, o + self._pos)
         return None
 
 def MetadataStart(builder):
     builder.StartObject(8)
 
 def MetadataAddOnnxHash(builder, onnxHash):
-    builder.PrependUOffsetTRelativeSlot(0, flatbuffers.number_types.UOffsetTFlags.py_type(onnxHash), 0)
+    builder.PrependUOffsetTRelativeSlot(0, onnxHash, 0)
 
 def MetadataAddDescription(builder, description):
-    builder.PrependUOffsetTRelativeSlot(1, flatbuffers.number_types.UOffsetTFlags.py_type(description), 0)
+    builder.PrependUOffsetTRelativeSlot(1, description, 0)
 
 def MetadataAddLicense(builder, license):
-    builder.PrependUOffsetTRelativeSlot(2, flatbuffers.number_types.UOffsetTFlags.py_type(license), 0)
+    builder.PrependUOffsetTRelativeSlot(2, license, 0)
 
 def MetadataAddCommit(builder, commit):
-    builder.PrependUOffsetTRelativeSlot(3, flatbuffers.number_types.UOffsetTFlags.py_type(commit), 0)
+    builder.PrependUOffsetTRelativeSlot(3, commit, 0)
 
 def MetadataAddCodeRepository(builder, codeRepository):
-    builder.PrependUOffsetTRelativeSlot(4, flatbuffers.number_types.UOffsetTFlags.py_type(codeRepository), 0)
+    builder.PrependUOffsetTRelativeSlot(4, codeRepository, 0)
 
 def MetadataAddModelRepository(builder, modelRepository):
-    builder.PrependUOffsetTRelativeSlot(5, flatbuffers.number_types.UOffsetTFlags.py_type(modelRepository), 0)
+    builder.PrependUOffsetTRelativeSlot(5, modelRepository, 0)
 
 def MetadataAddRunId(builder, runId):
-    builder.PrependUOffsetTRelativeSlot(6, flatbuffers.number_types.UOffsetTFlags.py_type(runId), 0)
+    builder.PrependUOffsetTRelativeSlot(6, runId, 0)
 
 def MetadataAddRunUrl(builder, runUrl):
-    builder.PrependUOffsetTRelativeSlot(7, flatbuffers.number_types.UOffsetTFlags.py_type(runUrl), 0)
+    builder.PrependUOffsetTRelativeSlot(7, runUrl, 0)
 
 def MetadataEnd(builder):
     return builder.EndObject()
@@ -5999,7 +6019,7 @@ class MetadataT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -6061,51 +6081,48 @@ class MetadataT(object):
 
 
 class Model(object):
-    __slots__ = ['_tab']
+    __slots__ = ['_buf', '_pos', '_offs']
 
     @classmethod
     def GetRootAs(cls, buf, offset=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, offset)
-        x = Model()
-        x.Init(buf, n + offset)
+        x = cls.__new__(cls)
+        x.Init(buf, _U32(buf, offset)[0] + offset)
         return x
 
     @classmethod
-    def GetRootAsModel(cls, buf, offset=0):
-        """This method is deprecated. Please switch to GetRootAs."""
-        return cls.GetRootAs(buf, offset)
-    @classmethod
     def ModelBufferHasIdentifier(cls, buf, offset, size_prefixed=False):
-        return flatbuffers.util.BufferHasIdentifier(buf, offset, b"\x52\x54\x45\x4E", size_prefixed=size_prefixed)
+        return _buffer_has_identifier(buf, offset, size_prefixed)
 
     # Model
     def Init(self, buf, pos):
-        self._tab = flatbuffers.table.Table(buf, pos)
+        self._buf = buf
+        self._pos = pos
+        self._offs = _FIELD_OFFSETS[3](buf, pos)
 
     # Model
     def SchemaVersion(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(4))
-        if o != 0:
-            return self._tab.Get(flatbuffers.number_types.Int32Flags, o + self._tab.Pos)
-        return 0
+        o = self._offs[0]
+        return _I32(self._buf, o + self._pos)[0] if o else 0
 
     # Model
     def Graph(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(6))
+        o = self._offs[1]
         if o != 0:
-            x = self._tab.Indirect(o + self._tab.Pos)
+            buf = self._buf
+            x = o + self._pos
             obj = Graph()
-            obj.Init(self._tab.Bytes, x)
+            obj.Init(buf, x + _U32(buf, x)[0])
             return obj
         return None
 
     # Model
     def Metadata(self):
-        o = flatbuffers.number_types.UOffsetTFlags.py_type(self._tab.Offset(8))
+        o = self._offs[2]
         if o != 0:
-            x = self._tab.Indirect(o + self._tab.Pos)
+            buf = self._buf
+            x = o + self._pos
             obj = Metadata()
-            obj.Init(self._tab.Bytes, x)
+            obj.Init(buf, x + _U32(buf, x)[0])
             return obj
         return None
 
@@ -6116,10 +6133,10 @@ def ModelAddSchemaVersion(builder, schemaVersion):
     builder.PrependInt32Slot(0, schemaVersion, 0)
 
 def ModelAddGraph(builder, graph):
-    builder.PrependUOffsetTRelativeSlot(1, flatbuffers.number_types.UOffsetTFlags.py_type(graph), 0)
+    builder.PrependUOffsetTRelativeSlot(1, graph, 0)
 
 def ModelAddMetadata(builder, metadata):
-    builder.PrependUOffsetTRelativeSlot(2, flatbuffers.number_types.UOffsetTFlags.py_type(metadata), 0)
+    builder.PrependUOffsetTRelativeSlot(2, metadata, 0)
 
 def ModelEnd(builder):
     return builder.EndObject()
@@ -6146,7 +6163,7 @@ class ModelT(object):
 
     @classmethod
     def InitFromPackedBuf(cls, buf, pos=0):
-        n = flatbuffers.encode.Get(flatbuffers.packer.uoffset, buf, pos)
+        n = _U32(buf, pos)[0]
         return cls.InitFromBuf(buf, pos+n)
 
     @classmethod
@@ -6181,3 +6198,120 @@ class ModelT(object):
         return model
 
 
+# Reader classes for each `OperatorAttrs` union member, indexed by union type.
+_OPERATOR_ATTRS = (
+    None,
+    ArgMaxAttrs,
+    AveragePoolAttrs,
+    BatchNormalizationAttrs,
+    CastAttrs,
+    ConcatAttrs,
+    ConstantOfShapeAttrs,
+    ConvAttrs,
+    ConvTransposeAttrs,
+    FlattenAttrs,
+    GatherAttrs,
+    GemmAttrs,
+    GRUAttrs,
+    LeakyReluAttrs,
+    LSTMAttrs,
+    MaxPoolAttrs,
+    ReduceMeanAttrs,
+    ReshapeAttrs,
+    ResizeAttrs,
+    SplitAttrs,
+    SoftmaxAttrs,
+    TransposeAttrs,
+    ModAttrs,
+    ScatterElementsAttrs,
+    OneHotAttrs,
+    TopKAttrs,
+    HardSigmoidAttrs,
+    TriluAttrs,
+    ScatterNDAttrs,
+    NonMaxSuppressionAttrs,
+    LayerNormalizationAttrs,
+    RandomUniformAttrs,
+    EluAttrs,
+    RandomUniformLikeAttrs,
+    RandomNormalAttrs,
+    RandomNormalLikeAttrs,
+    GatherNDAttrs,
+    GeluAttrs,
+    EinsumAttrs,
+    IfAttrs,
+)
+
+# NumPy types of the inline data for each `ConstantData` union member, indexed
+# by union type.
+_CONSTANT_DATA_NUMPY = (None, '<f4', '<i4')
+
+# NumPy types for each `ConstantDataType`, indexed by data type.
+_CONSTANT_DATA_TYPE_NUMPY = ('<i4', '<f4')
+
+# `ConstantDataType` of the inline data for each `ConstantData` union member,
+# indexed by union type.
+_CONSTANT_DATA_DTYPE = (None, ConstantDataType.Float32, ConstantDataType.Int32)
+
+# Object API classes for each union member, indexed by union type.
+_OPERATOR_ATTRS_T = (
+    None,
+    ArgMaxAttrsT,
+    AveragePoolAttrsT,
+    BatchNormalizationAttrsT,
+    CastAttrsT,
+    ConcatAttrsT,
+    ConstantOfShapeAttrsT,
+    ConvAttrsT,
+    ConvTransposeAttrsT,
+    FlattenAttrsT,
+    GatherAttrsT,
+    GemmAttrsT,
+    GRUAttrsT,
+    LeakyReluAttrsT,
+    LSTMAttrsT,
+    MaxPoolAttrsT,
+    ReduceMeanAttrsT,
+    ReshapeAttrsT,
+    ResizeAttrsT,
+    SplitAttrsT,
+    SoftmaxAttrsT,
+    TransposeAttrsT,
+    ModAttrsT,
+    ScatterElementsAttrsT,
+    OneHotAttrsT,
+    TopKAttrsT,
+    HardSigmoidAttrsT,
+    TriluAttrsT,
+    ScatterNDAttrsT,
+    NonMaxSuppressionAttrsT,
+    LayerNormalizationAttrsT,
+    RandomUniformAttrsT,
+    EluAttrsT,
+    RandomUniformLikeAttrsT,
+    RandomNormalAttrsT,
+    RandomNormalLikeAttrsT,
+    GatherNDAttrsT,
+    GeluAttrsT,
+    EinsumAttrsT,
+    IfAttrsT,
+)
+
+_SCALAR_T = (
+    None,
+    IntScalarT,
+    FloatScalarT,
+)
+
+_NODE_KIND_T = (
+    None,
+    OperatorNodeT,
+    ConstantNodeT,
+    ValueNodeT,
+)
+
+_CONSTANT_DATA_T = (
+    None,
+    FloatDataT,
+    IntDataT,
+)